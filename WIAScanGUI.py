@@ -1,8 +1,7 @@
-import win32com.client
-import pythoncom
 from datetime import datetime
 import os
 import sys
+import math
 import cv2
 import numpy as np
 import tkinter as tk
@@ -10,7 +9,9 @@ from tkinter import ttk, messagebox, scrolledtext, filedialog
 from PIL import Image, ImageTk
 import json
 import threading
+from collections import deque
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # Get the correct path for bundled resources
 if getattr(sys, 'frozen', False):
@@ -34,19 +35,125 @@ WIA_INTENT_IMAGE_TYPE_COLOR = 0x00000001
 WIA_INTENT_IMAGE_TYPE_GRAYSCALE = 0x00000002
 WIA_INTENT_IMAGE_TYPE_TEXT = 0x00000004
 
+# Long side (px) that the scan is downsampled towards for document detection
+DETECT_SIZE = 1200
+
+# Minimum share of the gray variance that Otsu's split must explain before it
+# is trusted over the adaptive threshold
+OTSU_MIN_SEPARATION = 0.7
+
+# Gray levels below the lid level at which a background pixel is too dark to
+# be lid, so the Otsu split must have missed a document
+OTSU_LID_MARGIN = 40
+
+# cv2.rotate codes for a document's number of clockwise quarter turns
+ROTATE_CODES = {
+    1: cv2.ROTATE_90_CLOCKWISE,
+    2: cv2.ROTATE_180,
+    3: cv2.ROTATE_90_COUNTERCLOCKWISE,
+}
+
+
+def apply_white_balance(image, factors):
+    """Apply white balance correction factors [B, G, R] to image"""
+    if factors is None:
+        return image  # No calibration, return original
+
+    # Apply correction factors
+    corrected = image.astype(np.float32)
+    corrected[:, :, 0] *= factors[0]  # Blue
+    corrected[:, :, 1] *= factors[1]  # Green
+    corrected[:, :, 2] *= factors[2]  # Red
+
+    return np.clip(corrected, 0, 255).astype(np.uint8)
+
+
+def axis_aligned_slice(image, rect, size):
+    """Crop an upright rect from image as a view of size, or return None"""
+    # Only whole-pixel corners of an upright rectangle inside the image can be
+    # sliced; anything else (None) needs a real warp. The slice crops instead
+    # of resampling, so it is not pixel-identical to warpPerspective.
+    (tl, tr, br, bl) = rect
+    if not (tl[1] == tr[1] and bl[1] == br[1] and tl[0] == bl[0] and tr[0] == br[0]):
+        return None
+    if not np.array_equal(rect, np.round(rect)):
+        return None
+
+    x, y = int(tl[0]), int(tl[1])
+    w, h = size
+    if x < 0 or y < 0 or x + w > image.shape[1] or y + h > image.shape[0]:
+        return None
+    return image[y:y + h, x:x + w]
+
+
+def warp_document(image, matrix, rect, size):
+    """Warp one document out of the full scan, on the GPU when OpenCL is available"""
+    if not (cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()):
+        return cv2.warpPerspective(image, matrix, size)
+
+    # Upload only the document's bounding box (plus a margin for interpolation)
+    # and shift the matrix to match, instead of the whole scan
+    img_h, img_w = image.shape[:2]
+    x0 = max(0, int(rect[:, 0].min()) - 2)
+    y0 = max(0, int(rect[:, 1].min()) - 2)
+    x1 = min(img_w, int(rect[:, 0].max()) + 3)
+    y1 = min(img_h, int(rect[:, 1].max()) + 3)
+    shift = np.array([[1, 0, x0], [0, 1, y0], [0, 0, 1]], dtype=np.float64)
+
+    src = cv2.UMat(image[y0:y1, x0:x1])
+    return cv2.warpPerspective(src, matrix @ shift, size).get()
+
+
+def _encode_and_save(image, warped, matrix, rect, size, crop_px, rotation,
+                     white_balance_factors, output_path, jpg_quality):
+    """Warp, crop, rotate, color correct and save one document as JPEG"""
+    # Runs in a save worker thread, so only its arguments are used. warped is
+    # the preview's already cropped warp, or None to warp from the full scan.
+    if warped is None:
+        warped = axis_aligned_slice(image, rect, size)
+        if warped is None:
+            warped = warp_document(image, matrix, rect, size)
+
+        # Apply crop
+        if crop_px > 0:
+            h, w = warped.shape[:2]
+            if h > 2 * crop_px and w > 2 * crop_px:
+                warped = warped[crop_px:h - crop_px, crop_px:w - crop_px]
+
+    # Apply rotation
+    if rotation:
+        warped = cv2.rotate(warped, ROTATE_CODES[rotation])
+
+    # Apply white balance correction
+    warped = apply_white_balance(warped, white_balance_factors)
+
+    # Save as baseline JPEG without Huffman table optimization (one encoding pass)
+    cv2.imwrite(output_path, warped, [cv2.IMWRITE_JPEG_QUALITY, jpg_quality,
+                                      cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+                                      cv2.IMWRITE_JPEG_PROGRESSIVE, 0])
+    return output_path
+
 
 class CornerAdjustmentWindow:
     """Fullscreen window for adjusting corner points"""
 
-    def __init__(self, parent, image, corners, callback):
+    def __init__(self, parent, image, corners, callback, display_cache=None):
         self.parent = parent
-        self.original_image = image.copy()
+        self.original_image = image  # Only read, never drawn on
+        self.display_cache = display_cache  # Background photo kept between windows
         self.corners = corners.copy()
         self.callback = callback
         self.selected_corner = None
         self.dragging = False
         self.zoom_size = 150  # Size of zoom window
         self.zoom_factor = 3  # Zoom magnification
+        self._pending_redraw = False  # Drag redraw already scheduled
+        self._last_drag = None  # Latest drag position (canvas coordinates)
+
+        # Reusable buffers for the zoom view (source crop and magnified result)
+        region_size = 2 * (self.zoom_size // (2 * self.zoom_factor))
+        self._zoom_scratch = np.empty((region_size, region_size, 3), dtype=np.uint8)
+        self._zoom_dst = np.empty((self.zoom_size, self.zoom_size, 3), dtype=np.uint8)
 
         # Create fullscreen window
         self.window = tk.Toplevel(parent)
@@ -72,6 +179,10 @@ class CornerAdjustmentWindow:
                                      highlightbackground='yellow',
                                      width=self.zoom_size, height=self.zoom_size)
 
+        # Persistent zoom image; each update pastes new pixels into it
+        self.zoom_photo = ImageTk.PhotoImage('RGB', (self.zoom_size, self.zoom_size))
+        self.zoom_canvas.create_image(0, 0, image=self.zoom_photo, anchor='nw')
+
         # Bind events
         self.canvas.bind('<Button-1>', self.on_mouse_down)
         self.canvas.bind('<B1-Motion>', self.on_mouse_drag)
@@ -86,6 +197,9 @@ class CornerAdjustmentWindow:
         # Wait for window to be drawn
         self.window.update()
 
+        # Downscale the image once; drag redraws only touch display-sized data
+        self.prepare_display()
+
         # Display image
         self.display_image()
 
@@ -113,16 +227,14 @@ class CornerAdjustmentWindow:
                                padx=20, pady=10)
         cancel_btn.pack(side=tk.LEFT, padx=10)
 
-    def display_image(self):
-        """Display image with corner points"""
+    def prepare_display(self):
+        """Compute display scale and cache the downscaled background image"""
         # Get canvas size
-        canvas_width = self.canvas.winfo_width()
+        # The fullscreen window does not resize, so the width is read once here
+        self.canvas_width = self.canvas.winfo_width()
+        canvas_width = self.canvas_width
         canvas_height = self.canvas_height
 
-        # Create image with corners drawn
-        display_img = self.original_image.copy()
-
-        # Scale corners to display coordinates
         img_h, img_w = self.original_image.shape[:2]
         scale = min(canvas_width / img_w, canvas_height / img_h)
 
@@ -138,37 +250,91 @@ class CornerAdjustmentWindow:
         self.offset_x = (canvas_width - new_w) // 2
         self.offset_y = (canvas_height - new_h) // 2
 
-        # Draw lines between corners
-        for i in range(4):
-            pt1 = tuple(self.corners[i].astype(int))
-            pt2 = tuple(self.corners[(i + 1) % 4].astype(int))
-            cv2.line(display_img, pt1, pt2, (0, 255, 0), 4)
-
-        # Draw corner points (larger and more visible - doubled size)
-        for i, pt in enumerate(self.corners):
-            pt_int = tuple(pt.astype(int))
-            # Draw outer circle (doubled from 25 to 50)
-            cv2.circle(display_img, pt_int, 50, (0, 255, 0), -1)
-            # Draw inner circle (doubled from 20 to 40)
-            cv2.circle(display_img, pt_int, 40, (255, 255, 255), -1)
-            # Draw number
-            cv2.putText(display_img, str(i + 1), pt_int,
-                        cv2.FONT_HERSHEY_SIMPLEX, 2.5, (0, 0, 0), 6)
-
-        # Resize image
-        display_img = cv2.resize(display_img, (new_w, new_h))
-
-        # Convert to RGB
-        display_img = cv2.cvtColor(display_img, cv2.COLOR_BGR2RGB)
-
-        # Convert to PhotoImage
-        img_pil = Image.fromarray(display_img)
-        self.photo = ImageTk.PhotoImage(img_pil)
-
-        # Display on canvas
+        # Reuse the background from an earlier window on the same image and size
+        cache = self.display_cache
+        if (cache is not None and cache.get('image') is self.original_image
+                and cache.get('size') == (new_w, new_h)):
+            self.bg_photo = cache['photo']
+        else:
+            # INTER_AREA for shrinking; an image that already fits is used as-is
+            if scale < 1.0:
+                display_bg = cv2.resize(self.original_image, (new_w, new_h),
+                                        interpolation=cv2.INTER_AREA)
+            else:
+                display_bg = self.original_image
+
+            # PIL swaps BGR to RGB while copying the buffer; no cvtColor pass
+            img_pil = Image.frombuffer("RGB", (new_w, new_h), np.ascontiguousarray(display_bg),
+                                       "raw", "BGR", 0, 1)
+            self.bg_photo = ImageTk.PhotoImage(img_pil)
+
+            if cache is not None:
+                cache['image'] = self.original_image
+                cache['size'] = (new_w, new_h)
+                cache['photo'] = self.bg_photo
+
+        # Place the background once; it never changes while dragging
         self.canvas.delete("all")
         self.canvas.create_image(self.offset_x, self.offset_y,
-                                 image=self.photo, anchor='nw')
+                                 image=self.bg_photo, anchor='nw')
+
+        # Create overlay items once; redraws only move them
+        line_width = max(1, round(4 * scale))
+        self.edge_ids = [self.canvas.create_line(0, 0, 0, 0, fill='#00ff00', width=line_width)
+                         for _ in range(4)]
+
+        # Each corner marker is rendered once into a sprite and shown as one image item
+        self.corner_sprites = [self.render_corner_sprite(i + 1, scale) for i in range(4)]
+        self.corner_ids = [self.canvas.create_image(0, 0, image=sprite, anchor='center')
+                           for sprite in self.corner_sprites]
+
+    def render_corner_sprite(self, number, scale):
+        """Render a numbered corner marker into a transparent PhotoImage"""
+        # Marker sizes scaled to display coordinates
+        outer_radius = max(2, round(50 * scale))  # Doubled from 25 to 50
+        inner_radius = max(1, round(40 * scale))  # Doubled from 20 to 40
+        font_scale = 2.5 * scale
+        font_thickness = max(1, round(6 * scale))
+
+        # The label starts at the marker center, so the sprite must also fit the text
+        (text_w, text_h), _ = cv2.getTextSize(str(number), cv2.FONT_HERSHEY_SIMPLEX,
+                                              font_scale, font_thickness)
+        half = max(outer_radius, text_w, text_h) + font_thickness
+        sprite = np.zeros((2 * half + 1, 2 * half + 1, 4), dtype=np.uint8)
+        center = (half, half)
+
+        # Draw outer circle, inner circle and number
+        cv2.circle(sprite, center, outer_radius, (0, 255, 0, 255), -1)
+        cv2.circle(sprite, center, inner_radius, (255, 255, 255, 255), -1)
+        cv2.putText(sprite, str(number), center,
+                    cv2.FONT_HERSHEY_SIMPLEX, font_scale, (0, 0, 0, 255), font_thickness)
+
+        return ImageTk.PhotoImage(Image.fromarray(sprite))
+
+    def display_image(self, corner=None):
+        """Display image with corner points, or only the items of one moved corner"""
+        # Scale corners to canvas coordinates
+        display_corners = (self.corners * self.scale +
+                           [self.offset_x, self.offset_y]).tolist()
+
+        # A single moved corner only affects its sprite and its two edges
+        if corner is None:
+            edges = range(4)
+            moved = range(4)
+        else:
+            edges = ((corner - 1) % 4, corner)
+            moved = (corner,)
+
+        # Move lines between corners
+        for i in edges:
+            x1, y1 = display_corners[i]
+            x2, y2 = display_corners[(i + 1) % 4]
+            self.canvas.coords(self.edge_ids[i], x1, y1, x2, y2)
+
+        # Move corner sprites
+        for i in moved:
+            x, y = display_corners[i]
+            self.canvas.coords(self.corner_ids[i], x, y)
 
     def show_zoom(self, canvas_x, canvas_y):
         """Show zoomed-in view around cursor"""
@@ -184,47 +350,45 @@ class CornerAdjustmentWindow:
         y2 = min(img_h, int(img_y + half_size))
 
         if x2 - x1 > 0 and y2 - y1 > 0:
-            # Extract region
-            region = self.original_image[y1:y2, x1:x2].copy()
+            region_h = y2 - y1
+            region_w = x2 - x1
+
+            # Copy region into the scratch buffer, converting to RGB on the way
+            region = cv2.cvtColor(self.original_image[y1:y2, x1:x2], cv2.COLOR_BGR2RGB,
+                                  dst=self._zoom_scratch[:region_h, :region_w])
 
-            # Draw crosshair at center
+            # Draw crosshair at center (blue, RGB order)
             center_x = int(img_x - x1)
             center_y = int(img_y - y1)
-            cv2.drawMarker(region, (center_x, center_y), (255, 0, 0),
+            cv2.drawMarker(region, (center_x, center_y), (0, 0, 255),
                            cv2.MARKER_CROSS, 20, 2)
 
-            # Zoom the region
-            zoom_h = (y2 - y1) * self.zoom_factor
-            zoom_w = (x2 - x1) * self.zoom_factor
-            zoomed = cv2.resize(region, (zoom_w, zoom_h), interpolation=cv2.INTER_NEAREST)
-
-            # Crop to fit zoom window
-            crop_h = min(self.zoom_size, zoom_h)
-            crop_w = min(self.zoom_size, zoom_w)
-            start_h = (zoom_h - crop_h) // 2
-            start_w = (zoom_w - crop_w) // 2
-            zoomed = zoomed[start_h:start_h + crop_h, start_w:start_w + crop_w]
+            # Zoom the region (always fits the zoom window, see _zoom_scratch);
+            # clear the buffer first when the region is clipped at an image edge
+            zoom_h = region_h * self.zoom_factor
+            zoom_w = region_w * self.zoom_factor
+            if zoom_h < self.zoom_size or zoom_w < self.zoom_size:
+                self._zoom_dst.fill(0)
+            cv2.resize(region, (zoom_w, zoom_h), dst=self._zoom_dst[:zoom_h, :zoom_w],
+                       interpolation=cv2.INTER_NEAREST)
 
-            # Convert to RGB
-            zoomed = cv2.cvtColor(zoomed, cv2.COLOR_BGR2RGB)
-            img_pil = Image.fromarray(zoomed)
-            self.zoom_photo = ImageTk.PhotoImage(img_pil)
+            # Paste into the existing PhotoImage instead of creating a new one
+            img_pil = Image.frombuffer("RGB", (self.zoom_size, self.zoom_size), self._zoom_dst,
+                                       "raw", "RGB", 0, 1)
+            self.zoom_photo.paste(img_pil)
 
             # Position zoom window near cursor but not blocking it
             zoom_x = canvas_x + 30
             zoom_y = canvas_y + 30
 
             # Keep zoom window on screen
-            canvas_width = self.canvas.winfo_width()
-            if zoom_x + self.zoom_size > canvas_width:
+            if zoom_x + self.zoom_size > self.canvas_width:
                 zoom_x = canvas_x - self.zoom_size - 30
             if zoom_y + self.zoom_size > self.canvas_height:
                 zoom_y = canvas_y - self.zoom_size - 30
 
             # Place zoom canvas
             self.zoom_canvas.place(x=zoom_x, y=zoom_y)
-            self.zoom_canvas.delete("all")
-            self.zoom_canvas.create_image(0, 0, image=self.zoom_photo, anchor='nw')
 
     def hide_zoom(self):
         """Hide zoom window"""
@@ -245,18 +409,13 @@ class CornerAdjustmentWindow:
         """Handle mouse down event"""
         img_x, img_y = self.canvas_to_image_coords(event.x, event.y)
 
-        # Find nearest corner
-        min_dist = float('inf')
-        closest_corner = None
-
-        for i, pt in enumerate(self.corners):
-            dist = np.sqrt((pt[0] - img_x) ** 2 + (pt[1] - img_y) ** 2)
-            if dist < min_dist:
-                min_dist = dist
-                closest_corner = i
+        # Find nearest corner (squared distances, no sqrt needed for argmin)
+        diffs = self.corners - np.array([img_x, img_y], dtype=np.float32)
+        dist_sq = np.einsum('ij,ij->i', diffs, diffs)
+        closest_corner = int(dist_sq.argmin())
 
         # Select corner if close enough (100 pixels in image space - doubled from 50)
-        if min_dist < 100:
+        if dist_sq[closest_corner] < 100 ** 2:
             self.selected_corner = closest_corner
             self.dragging = True
             self.show_zoom(event.x, event.y)
@@ -264,22 +423,38 @@ class CornerAdjustmentWindow:
     def on_mouse_drag(self, event):
         """Handle mouse drag event"""
         if self.dragging and self.selected_corner is not None:
-            img_x, img_y = self.canvas_to_image_coords(event.x, event.y)
+            # Keep only the latest position and redraw once when idle
+            self._last_drag = (event.x, event.y)
+            if not self._pending_redraw:
+                self._pending_redraw = True
+                self.window.after_idle(self._flush_drag)
+
+    def _flush_drag(self):
+        """Apply the latest drag position and redraw once"""
+        self._pending_redraw = False
+        if not self.dragging or self.selected_corner is None:
+            return
 
-            # Clamp to image bounds
-            img_h, img_w = self.original_image.shape[:2]
-            img_x = max(0, min(img_w - 1, img_x))
-            img_y = max(0, min(img_h - 1, img_y))
+        canvas_x, canvas_y = self._last_drag
+        img_x, img_y = self.canvas_to_image_coords(canvas_x, canvas_y)
 
-            # Update corner position
-            self.corners[self.selected_corner] = [img_x, img_y]
+        # Clamp to image bounds
+        img_h, img_w = self.original_image.shape[:2]
+        img_x = max(0, min(img_w - 1, img_x))
+        img_y = max(0, min(img_h - 1, img_y))
 
-            # Redraw
-            self.display_image()
-            self.show_zoom(event.x, event.y)
+        # Update corner position
+        self.corners[self.selected_corner] = [img_x, img_y]
+
+        # Redraw
+        self.display_image(self.selected_corner)
+        self.show_zoom(canvas_x, canvas_y)
 
     def on_mouse_up(self, event):
         """Handle mouse up event"""
+        # Apply a drag position that has not been drawn yet
+        if self._pending_redraw:
+            self._flush_drag()
         self.dragging = False
         self.selected_corner = None
         self.hide_zoom()
@@ -303,10 +478,17 @@ class ScannerGUI:
         # Scanner variables
         self.scanner = None
         self.tiff_filepath = None
+        self.tiff_save_thread = None  # Background write of the TIFF into the output folder
         self.cropped_images = []
         self.current_preview_index = 0
         self.full_scan_image = None  # Store full scan for manual add
         self.image_exif_data = {}  # Store EXIF data per image {index: {"date": "", "title": ""}}
+        self.adjust_display_cache = {}  # Corner adjustment background for the current scan
+        self.warp_map_cache = None  # (key, map1, map2) of the last previewed warp
+        self.warp_buf = None  # Reused output buffer of four_point_transform
+        self.preview_buf = None  # Canvas-sized resize output of display_preview
+        self.log_queue = deque()  # Messages waiting for the GUI thread to show them
+        self.log_flush_pending = False
 
         # Load settings
         self.load_settings()
@@ -329,10 +511,14 @@ class ScannerGUI:
             "white_balance_factors": None  # Will store [B, G, R] correction factors
         }
 
+        # Last settings text written to (or read from) disk
+        self.saved_settings_text = None
+
         try:
             if os.path.exists(SETTINGS_FILE):
                 with open(SETTINGS_FILE, 'r') as f:
-                    self.settings = json.load(f)
+                    self.saved_settings_text = f.read()
+                self.settings = json.loads(self.saved_settings_text)
                 # Don't load EXIF date/title from settings - they're per-image now
                 if "exif_date" in self.settings:
                     del self.settings["exif_date"]
@@ -344,10 +530,14 @@ class ScannerGUI:
             self.settings = default_settings
 
     def save_settings(self):
-        """Save settings to file"""
+        """Save settings to file (skipped if unchanged since the last save)"""
         try:
+            settings_text = json.dumps(self.settings, indent=4)
+            if settings_text == self.saved_settings_text:
+                return
             with open(SETTINGS_FILE, 'w') as f:
-                json.dump(self.settings, f, indent=4)
+                f.write(settings_text)
+            self.saved_settings_text = settings_text
         except Exception as e:
             print(f"Error saving settings: {e}")
 
@@ -452,10 +642,10 @@ class ScannerGUI:
         ttk.Label(exif_frame, text="EXIF Date (YYYY:MM:DD):", underline=5).grid(row=0, column=0, sticky=tk.W, padx=5,
                                                                                 pady=5)
         self.exif_date_var = tk.StringVar(value="")
-        exif_date_entry = ttk.Entry(exif_frame, textvariable=self.exif_date_var, width=20)
-        exif_date_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
-        self.root.bind('<Alt-t>', lambda e: exif_date_entry.focus_set())
-        self.root.bind('<Alt-T>', lambda e: exif_date_entry.focus_set())
+        self.exif_date_entry = ttk.Entry(exif_frame, textvariable=self.exif_date_var, width=20)
+        self.exif_date_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
+        self.root.bind('<Alt-t>', lambda e: self.exif_date_entry.focus_set())
+        self.root.bind('<Alt-T>', lambda e: self.exif_date_entry.focus_set())
 
         ttk.Label(exif_frame, text="(Per image - set after scan)",
                   font=('Arial', 8, 'italic')).grid(row=1, column=0, columnspan=2, sticky=tk.W, padx=5)
@@ -463,9 +653,9 @@ class ScannerGUI:
         # EXIF Title - per image
         ttk.Label(exif_frame, text="Title:", underline=1).grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
         self.exif_title_var = tk.StringVar(value="")
-        exif_title_entry = ttk.Entry(exif_frame, textvariable=self.exif_title_var, width=20)
-        exif_title_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
-        self.root.bind('<Alt-i>', lambda e: exif_title_entry.focus_set())
+        self.exif_title_entry = ttk.Entry(exif_frame, textvariable=self.exif_title_var, width=20)
+        self.exif_title_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
+        self.root.bind('<Alt-i>', lambda e: self.exif_title_entry.focus_set())
 
         # Progress/Log Frame
         log_frame = ttk.LabelFrame(left_frame, text="Status", padding="10")
@@ -483,6 +673,10 @@ class ScannerGUI:
         self.canvas = tk.Canvas(preview_frame, bg='gray', width=600, height=500)
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
+        # Track the canvas size from resize events instead of querying Tk per redraw
+        self.canvas_size = (600, 500)
+        self.canvas.bind('<Configure>', self.on_canvas_configure)
+
         # Navigation and action buttons at bottom
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
@@ -578,8 +772,8 @@ class ScannerGUI:
         self.root.bind('<Alt-B>', lambda e: self.browse_folder())
 
         # Bottom buttons
-        self.root.bind('<Alt-s>', lambda e: self.start_scan())
-        self.root.bind('<Alt-S>', lambda e: self.start_scan())
+        self.root.bind('<Alt-s>', lambda e: self.start_scan() if str(self.scan_btn['state']) == 'normal' else None)
+        self.root.bind('<Alt-S>', lambda e: self.start_scan() if str(self.scan_btn['state']) == 'normal' else None)
         self.root.bind('<Alt-p>', lambda e: self.prev_image() if str(self.prev_btn['state']) == 'normal' else None)
         self.root.bind('<Alt-P>', lambda e: self.prev_image() if str(self.prev_btn['state']) == 'normal' else None)
         self.root.bind('<Left>', lambda e: self.prev_image() if str(self.prev_btn['state']) == 'normal' else None)
@@ -633,6 +827,9 @@ class ScannerGUI:
     def calibration_thread(self):
         """Calibration scan operation in separate thread"""
         try:
+            # pywin32 is only imported once a scan starts, keeping it off the startup path
+            import pythoncom
+
             # Initialize COM for this thread
             pythoncom.CoInitialize()
 
@@ -652,17 +849,9 @@ class ScannerGUI:
                 pythoncom.CoUninitialize()
                 return
 
-            # Save temporary file
-            if getattr(sys, 'frozen', False):
-                temp_dir = os.path.dirname(sys.executable)
-            else:
-                temp_dir = os.path.dirname(os.path.abspath(__file__))
-
-            cal_filepath = os.path.join(temp_dir, "calibration_scan.tif")
-            image.SaveFile(cal_filepath)
-
-            # Load and analyze the calibration image
-            cal_image = cv2.imread(cal_filepath)
+            # Decode the calibration image straight from the transferred file data
+            cal_data = np.frombuffer(bytes(image.FileData.BinaryData), dtype=np.uint8)
+            cal_image = cv2.imdecode(cal_data, cv2.IMREAD_COLOR)
 
             if cal_image is None:
                 self.log("ERROR: Could not load calibration image")
@@ -692,10 +881,6 @@ class ScannerGUI:
             self.settings["white_balance_factors"] = factors
             self.save_settings()
 
-            # Clean up temp file
-            if os.path.exists(cal_filepath):
-                os.remove(cal_filepath)
-
             self.log(f"Calibration complete! Factors: B={factors[0]:.3f}, G={factors[1]:.3f}, R={factors[2]:.3f}")
             self.root.after(0, self.update_calibration_status)
             self.root.after(0, lambda: messagebox.showinfo(
@@ -713,28 +898,31 @@ class ScannerGUI:
             except:
                 pass
 
-    def apply_white_balance(self, image):
-        """Apply white balance correction to image"""
-        factors = self.settings.get("white_balance_factors")
-
-        if factors is None:
-            return image  # No calibration, return original
-
-        # Apply correction factors
-        corrected = image.astype(np.float32)
-        corrected[:, :, 0] *= factors[0]  # Blue
-        corrected[:, :, 1] *= factors[1]  # Green
-        corrected[:, :, 2] *= factors[2]  # Red
+    def log(self, message):
+        """Add message to log (callable from any thread)"""
+        # Queue the message and let the GUI thread show everything queued in one go
+        self.log_queue.append(message)
+        if not self.log_flush_pending:
+            self.log_flush_pending = True
+            try:
+                self.root.after(0, self.flush_log)
+            except (RuntimeError, tk.TclError):
+                # The window was closed while a worker thread was still logging
+                pass
 
-        return np.clip(corrected, 0, 255).astype(np.uint8)
+    def flush_log(self):
+        """Append the queued log messages to the log widget"""
+        self.log_flush_pending = False
+        lines = []
+        while self.log_queue:
+            lines.append(self.log_queue.popleft())
+        if not lines:
+            return
 
-    def log(self, message):
-        """Add message to log"""
         self.log_text.config(state='normal')
-        self.log_text.insert(tk.END, message + "\n")
+        self.log_text.insert(tk.END, "\n".join(lines) + "\n")
         self.log_text.see(tk.END)
         self.log_text.config(state='disabled')
-        self.root.update()
 
     def start_scan(self):
         """Start scanning in a separate thread"""
@@ -752,12 +940,10 @@ class ScannerGUI:
         self.log_text.config(state='normal')
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state='disabled')
-        self.canvas.delete("all")
 
-        # Clear EXIF fields and data
-        self.exif_date_var.set("")
-        self.exif_title_var.set("")
-        self.image_exif_data = {}
+        # Drop the previous scan and disable its controls, so nothing edits or
+        # keeps it while the new one comes in
+        self.reset_preview()
 
         # Start scan in thread
         thread = threading.Thread(target=self.scan_thread)
@@ -767,6 +953,9 @@ class ScannerGUI:
     def scan_thread(self):
         """Scan operation in separate thread"""
         try:
+            # pywin32 is only imported once a scan starts, keeping it off the startup path
+            import pythoncom
+
             # Initialize COM for this thread - MUST be first
             pythoncom.CoInitialize()
 
@@ -786,47 +975,40 @@ class ScannerGUI:
                 pythoncom.CoUninitialize()
                 return
 
-            # Save TIFF if enabled
+            # Decode the scan once straight from the transferred file data;
+            # it is reused for detection and manual add
+            scan_bytes = bytes(image.FileData.BinaryData)
+            scan_data = np.frombuffer(scan_bytes, dtype=np.uint8)
+            scan_image = cv2.imdecode(scan_data, cv2.IMREAD_COLOR)
+
+            if scan_image is None:
+                self.log("ERROR: Could not decode scan")
+                pythoncom.CoUninitialize()
+                return
+
+            # Save TIFF if enabled, writing the same bytes in the background during detection
+            tiff_filepath = None
             if self.save_tiff_var.get():
                 self.log("Saving TIFF file...")
-                self.tiff_filepath = self.save_image(image)
-                if self.tiff_filepath:
-                    self.log(f"TIFF saved: {self.tiff_filepath}")
-                else:
+                tiff_filepath = self.save_image(scan_bytes)
+                if not tiff_filepath:
                     self.log("ERROR: Failed to save TIFF")
                     pythoncom.CoUninitialize()
                     return
-            else:
-                # Save temporary TIFF for processing in script directory
-                self.log("Creating temporary file for processing...")
-                if getattr(sys, 'frozen', False):
-                    # When frozen, use executable directory
-                    temp_dir = os.path.dirname(sys.executable)
-                else:
-                    # When running as script
-                    temp_dir = os.path.dirname(os.path.abspath(__file__))
-                self.tiff_filepath = os.path.join(temp_dir, "temp_scan.tif")
-                image.SaveFile(self.tiff_filepath)
-
-            # Store full scan image for manual add
-            self.full_scan_image = cv2.imread(self.tiff_filepath)
 
             # Detect and crop documents
             self.log("Detecting documents...")
-            self.cropped_images = self.detect_and_crop_documents(self.tiff_filepath)
+            cropped_images = self.detect_and_crop_documents(scan_image)
 
-            if self.cropped_images:
-                self.log(f"Detected {len(self.cropped_images)} document(s)")
-                self.current_preview_index = 0
-                self.root.after(0, self.display_preview)
-                self.root.after(0, self.enable_preview_controls)
+            if cropped_images:
+                self.log(f"Detected {len(cropped_images)} document(s)")
             else:
                 self.log("No documents detected - use 'Add Image' to manually add")
-                self.root.after(0, self.enable_preview_controls)
 
-            # Delete temp TIFF if not saving
-            if not self.save_tiff_var.get() and os.path.exists(self.tiff_filepath):
-                os.remove(self.tiff_filepath)
+            # Hand the scan and its documents to the GUI thread, which owns the
+            # preview state
+            self.root.after(0, self.show_detected_documents, scan_image, cropped_images,
+                            tiff_filepath)
 
             # Uninitialize COM
             pythoncom.CoUninitialize()
@@ -838,9 +1020,21 @@ class ScannerGUI:
             except:
                 pass
 
+    def show_detected_documents(self, scan_image, cropped_images, tiff_filepath):
+        """Show the documents detected by scan_thread (runs on the GUI thread)"""
+        self.full_scan_image = scan_image
+        self.tiff_filepath = tiff_filepath
+        self.cropped_images = cropped_images
+        self.current_preview_index = 0
+        if self.cropped_images:
+            self.display_preview()
+        self.enable_preview_controls()
+
     def setup_scanner(self):
         """Initialize WIA and find the scanner."""
         try:
+            import win32com.client
+
             device_manager = win32com.client.Dispatch("WIA.DeviceManager")
             scanner = None
 
@@ -867,16 +1061,19 @@ class ScannerGUI:
         try:
             item = scanner.Items(1)
 
+            # Index the item's properties once instead of searching per property
+            props_by_id = self.index_properties(item)
+
             # Set properties
             dpi = self.dpi_var.get()
-            self.set_property_by_id(item, 6147, dpi, "Horizontal Resolution")
-            self.set_property_by_id(item, 6148, dpi, "Vertical Resolution")
-            self.set_property_by_id(item, 6146, WIA_INTENT_IMAGE_TYPE_COLOR, "Color Mode")
+            self.set_property_by_id(props_by_id, 6147, dpi, "Horizontal Resolution")
+            self.set_property_by_id(props_by_id, 6148, dpi, "Vertical Resolution")
+            self.set_property_by_id(props_by_id, 6146, WIA_INTENT_IMAGE_TYPE_COLOR, "Color Mode")
 
             # Set scan area based on distance (Y only, X is full width)
             distance = self.distance_var.get()
             y_extent = int(distance * dpi)
-            self.set_property_by_id(item, 6152, y_extent, "Y Extent")
+            self.set_property_by_id(props_by_id, 6152, y_extent, "Y Extent")
             # Don't set X Extent - let it use the scanner's full width
 
             # Perform scan
@@ -887,21 +1084,37 @@ class ScannerGUI:
             self.log(f"Error during scan: {e}")
             return None
 
-    def set_property_by_id(self, item, prop_id, value, prop_name="Unknown"):
-        """Safely set a property by ID."""
+    def index_properties(self, item):
+        """Map PropertyID to property for a WIA item, walking its properties once."""
+        props_by_id = {}
         try:
             for i in range(1, item.Properties.Count + 1):
                 prop = item.Properties(i)
-                if prop.PropertyID == prop_id:
-                    prop.Value = value
-                    return True
-            return False
+                props_by_id[prop.PropertyID] = prop
+        except:
+            pass
+        return props_by_id
+
+    def set_property_by_id(self, props_by_id, prop_id, value, prop_name="Unknown"):
+        """Safely set a property by ID."""
+        try:
+            prop = props_by_id.get(prop_id)
+            if prop is None:
+                return False
+            prop.Value = value
+            return True
         except:
             return False
 
-    def save_image(self, image):
-        """Save the scanned image as TIFF."""
+    def save_image(self, scan_bytes):
+        """Save the scanned TIFF into the output folder"""
+        # The file is written in a background thread; the reserved path is
+        # returned right away
         try:
+            # Let the previous scan's write finish so its name counts as taken
+            if self.tiff_save_thread is not None:
+                self.tiff_save_thread.join()
+
             output_folder = self.settings.get("output_folder", "Scans")
             if not os.path.exists(output_folder):
                 os.makedirs(output_folder)
@@ -917,76 +1130,171 @@ class ScannerGUI:
                 filepath = os.path.join(output_folder, filename)
                 counter += 1
 
-            image.SaveFile(filepath)
+            self.tiff_save_thread = threading.Thread(target=self.write_tiff,
+                                                     args=(scan_bytes, filepath))
+            # Not a daemon, so closing the app cannot leave a truncated TIFF
+            self.tiff_save_thread.start()
             return filepath
         except Exception as e:
             self.log(f"Error saving image: {e}")
             return None
 
-    def detect_and_crop_documents(self, image_path):
-        """Detect and crop documents from scanned image"""
-        image = cv2.imread(image_path)
+    def write_tiff(self, scan_bytes, filepath):
+        """Write the transferred scan file data to its final path"""
+        try:
+            with open(filepath, 'wb') as f:
+                f.write(scan_bytes)
+            self.log(f"TIFF saved: {filepath}")
+        except Exception as e:
+            self.log(f"Error saving image: {e}")
+
+    def detect_and_crop_documents(self, image):
+        """Detect and crop documents from decoded scan image"""
         if image is None:
             return []
 
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        blur = cv2.GaussianBlur(gray, (7, 7), 0)
-        thresh = cv2.adaptiveThreshold(blur, 255, cv2.ADAPTIVE_THRESH_MEAN_C,
-                                       cv2.THRESH_BINARY_INV, blockSize=51, C=10)
-
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (25, 25))
-        closed = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
-
-        contours, _ = cv2.findContours(closed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # Detect on a smaller image; page outlines survive the downscale.
+        # Each pyrDown blurs and halves in one pass, replacing the separate
+        # full-resolution GaussianBlur. Halve until the long side is at most
+        # twice DETECT_SIZE, so the work no longer grows with the scan DPI.
+        detect_scale = 1.0
+        small = image
+        while max(small.shape[:2]) > 2 * DETECT_SIZE:
+            small = cv2.pyrDown(small)
+            detect_scale /= 2
+
+        # Kernel sizes are scaled down with the image (full-res 51 and 25)
+        block_size = max(3, int(51 * detect_scale) | 1)
+        kernel_size = max(3, round(25 * detect_scale) | 1)
+
+        # Each step writes into one of two reused buffers instead of allocating.
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        if detect_scale == 1.0:
+            # Low-DPI scans skip the pyrDown loop, so blur them explicitly
+            gray = cv2.GaussianBlur(gray, (5, 5), 0)
+        thresh_buf = np.empty_like(gray)
+        closed_buf = np.empty_like(gray)
 
         h, w = gray.shape
-        img_area = h * w
-        min_area = img_area * 0.01
+        min_area = h * w * 0.01
+
+        # A global Otsu threshold is much cheaper than the adaptive mean and is
+        # enough when dark documents stand out clearly from a light, even lid.
+        # It keeps the full closing kernel, which bridges light bands running
+        # across a photo. A mask that reaches all four borders is the
+        # background, not a document.
+        contours = None
+        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU,
+                                  dst=thresh_buf)
+        if self.otsu_mask_usable(gray, thresh):
+            contours = self.find_document_contours(thresh, kernel_size, min_area, closed_buf)
+            for cnt in contours:
+                x, y, box_w, box_h = cv2.boundingRect(cnt)
+                if x == 0 and y == 0 and box_w == w and box_h == h:
+                    contours = None
+                    break
+
+        if contours is None:
+            thresh = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C,
+                                           cv2.THRESH_BINARY_INV, blockSize=block_size, C=10,
+                                           dst=thresh_buf)
+            contours = self.find_document_contours(thresh, kernel_size, min_area, closed_buf)
 
+        # Documents only store their corners in scan coordinates; the scan
+        # itself is kept once in full_scan_image
         cropped_data = []
         for cnt in contours:
-            area = cv2.contourArea(cnt)
-            if area < min_area:
-                continue
-
             rect = cv2.minAreaRect(cnt)
-            box = cv2.boxPoints(rect)
-            box = np.float32(box)
+            angle = rect[2]
+            if min(abs(angle), abs(abs(angle) - 90)) < 1.0:
+                # Nearly upright: snap to whole-pixel bounding box corners so
+                # the crop is a plain slice instead of a perspective warp. The
+                # far corners are the last pixel inside the box, not one past it.
+                x, y, box_w, box_h = cv2.boundingRect(cnt)
+                left, top = round(x / detect_scale), round(y / detect_scale)
+                right = round((x + box_w) / detect_scale) - 1
+                bottom = round((y + box_h) / detect_scale) - 1
+                box = np.float32([[left, top], [right, top],
+                                  [right, bottom], [left, bottom]])
+            else:
+                box = cv2.boxPoints(rect)
+
+                # Map back to full-resolution coordinates
+                box = np.float32(box / detect_scale)
 
             # Order the points properly
             box = self.order_points(box)
 
+            # Corners are only ever replaced, never edited in place, so the
+            # original can share the read-only array instead of a copy
+            box.setflags(write=False)
             cropped_data.append({
-                'image': image.copy(),
                 'corners': box,
-                'original_corners': box.copy()
+                'original_corners': box,
+                'rotation': 0
             })
 
         return cropped_data
 
-    def rotate_cw(self):
-        """Rotate current image 90 degrees clockwise"""
-        if not self.cropped_images:
-            return
+    def find_document_contours(self, thresh, kernel_size, min_area, dst):
+        """Close thresh into dst and return its outer contours of at least min_area"""
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, kernel_size))
+        closed = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel, dst=dst)
 
-        data = self.cropped_images[self.current_preview_index]
+        contours, _ = cv2.findContours(closed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_TC89_KCOS)
 
-        # Get original image dimensions
-        old_h, old_w = data['image'].shape[:2]
+        # Bounding box area is an upper bound on contour area and cheaper to get,
+        # so use it to drop small artifacts before computing polygon areas
+        large_contours = []
+        for cnt in contours:
+            _, _, box_w, box_h = cv2.boundingRect(cnt)
+            if box_w * box_h >= min_area:
+                large_contours.append(cnt)
+
+        # Filter out small contours in one pass over their areas
+        areas = np.fromiter((cv2.contourArea(cnt) for cnt in large_contours),
+                            dtype=np.float64, count=len(large_contours))
+        return [large_contours[i] for i in np.flatnonzero(areas >= min_area)]
+
+    def otsu_mask_usable(self, gray, mask):
+        """Check that an inverted Otsu mask of gray marks documents on the lid"""
+        # A good split alone does not say which side is the documents
+        if self.threshold_separation(gray, mask) < OTSU_MIN_SEPARATION:
+            return False
 
-        # Rotate image 90 degrees clockwise
-        data['image'] = cv2.rotate(data['image'], cv2.ROTATE_90_CLOCKWISE)
+        # Documents are the minority on a lid; a dark background would be the majority
+        if cv2.countNonZero(mask) >= mask.size / 2:
+            return False
 
-        # Get new image dimensions
-        new_h, new_w = data['image'].shape[:2]
+        # The rest must be lid: a page between two other levels ends up on the
+        # light side, so reject the mask if a document-sized share of it is
+        # clearly darker than the most common (lid) level
+        hist = cv2.calcHist([gray], [0], cv2.bitwise_not(mask), [256], [0, 256]).ravel()
+        lid_level = int(hist.argmax())
+        too_dark = hist[:max(0, lid_level - OTSU_LID_MARGIN)].sum()
+        return too_dark < mask.size * 0.01
+
+    def threshold_separation(self, gray, mask):
+        """Share of the variance of gray explained by splitting it at mask (0 to 1)"""
+        mean, stddev = cv2.meanStdDev(gray)
+        total_var = stddev[0, 0] ** 2
+        w0 = cv2.countNonZero(mask) / mask.size
+        if total_var == 0 or w0 in (0, 1):
+            return 0.0
+
+        # Class means from the masked mean and the overall mean
+        m0 = cv2.mean(gray, mask=mask)[0]
+        m1 = (mean[0, 0] - w0 * m0) / (1 - w0)
+        return w0 * (1 - w0) * (m0 - m1) ** 2 / total_var
 
-        # Rotate corners: (x, y) -> (old_h - 1 - y, x)
-        new_corners = np.zeros_like(data['corners'])
-        for i, (x, y) in enumerate(data['corners']):
-            new_corners[i] = [old_h - 1 - y, x]
+    def rotate_cw(self):
+        """Rotate current image 90 degrees clockwise"""
+        if not self.cropped_images:
+            return
 
-        data['corners'] = new_corners
-        data['original_corners'] = new_corners.copy()
+        # Only the output orientation changes; corners stay in scan coordinates
+        data = self.cropped_images[self.current_preview_index]
+        data['rotation'] = (data['rotation'] + 1) % 4
 
         self.display_preview()
         self.log(f"Rotated image {self.current_preview_index + 1} clockwise")
@@ -996,24 +1304,9 @@ class ScannerGUI:
         if not self.cropped_images:
             return
 
+        # Only the output orientation changes; corners stay in scan coordinates
         data = self.cropped_images[self.current_preview_index]
-
-        # Get original image dimensions
-        old_h, old_w = data['image'].shape[:2]
-
-        # Rotate image 90 degrees counter-clockwise
-        data['image'] = cv2.rotate(data['image'], cv2.ROTATE_90_COUNTERCLOCKWISE)
-
-        # Get new image dimensions
-        new_h, new_w = data['image'].shape[:2]
-
-        # Rotate corners: (x, y) -> (y, old_w - 1 - x)
-        new_corners = np.zeros_like(data['corners'])
-        for i, (x, y) in enumerate(data['corners']):
-            new_corners[i] = [y, old_w - 1 - x]
-
-        data['corners'] = new_corners
-        data['original_corners'] = new_corners.copy()
+        data['rotation'] = (data['rotation'] - 1) % 4
 
         self.display_preview()
         self.log(f"Rotated image {self.current_preview_index + 1} counter-clockwise")
@@ -1033,11 +1326,12 @@ class ScannerGUI:
             [0, h - 1]
         ], dtype=np.float32)
 
-        # Add to cropped images
+        # Add to cropped images; the original shares the read-only corners
+        corners.setflags(write=False)
         self.cropped_images.append({
-            'image': self.full_scan_image.copy(),
             'corners': corners,
-            'original_corners': corners.copy()
+            'original_corners': corners,
+            'rotation': 0
         })
 
         # Navigate to the new image
@@ -1074,7 +1368,6 @@ class ScannerGUI:
             return
 
         data = self.cropped_images[self.current_preview_index]
-        image = data['image']
         corners = data['corners']
 
         # Load EXIF data for this image
@@ -1086,37 +1379,94 @@ class ScannerGUI:
             self.exif_date_var.set("")
             self.exif_title_var.set("")
 
-        # Apply transform
-        warped = self.four_point_transform(image, corners)
-
-        # Apply crop pixels
+        canvas_width, canvas_height = self.canvas_size
         crop_px = self.crop_pixels_var.get()
-        if crop_px > 0:
-            h, w = warped.shape[:2]
-            if h > 2 * crop_px and w > 2 * crop_px:
-                warped = warped[crop_px:h - crop_px, crop_px:w - crop_px]
 
-        # Convert to RGB for display
-        display_img = cv2.cvtColor(warped, cv2.COLOR_BGR2RGB)
+        # Reuse the last preview of this document if nothing it depends on changed
+        key = (corners.tobytes(), data['rotation'], crop_px, canvas_width, canvas_height)
+        cached_preview = data.get('preview')
+        if cached_preview is not None and cached_preview[0] == key:
+            self.show_preview_photo(cached_preview[1], canvas_width, canvas_height)
+            return
+
+        # Reuse the cropped warp after a rotation or canvas resize
+        warp_key = (corners.tobytes(), crop_px)
+        cached = data.get('warped')
+        if cached is not None and cached[0] == warp_key:
+            warped = cached[1]
+        else:
+            # Apply transform
+            warped = self.four_point_transform(self.full_scan_image, corners, cache_map=True)
+
+            # Apply crop pixels
+            if crop_px > 0:
+                h, w = warped.shape[:2]
+                if h > 2 * crop_px and w > 2 * crop_px:
+                    warped = warped[crop_px:h - crop_px, crop_px:w - crop_px]
+
+            # Keep a copy of the cropped warp so keep_images does not warp it again.
+            # Upright slices are views of the scan and cost nothing to redo.
+            if self.warp_buf is not None and np.shares_memory(warped, self.warp_buf):
+                data['warped'] = (warp_key, warped.copy())
+            else:
+                data.pop('warped', None)
+
+        # Apply rotation to the cropped result
+        if data['rotation']:
+            warped = cv2.rotate(warped, ROTATE_CODES[data['rotation']])
 
         # Resize to fit canvas
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-        h, w = display_img.shape[:2]
+        h, w = warped.shape[:2]
 
         scale = min(canvas_width / w, canvas_height / h, 1.0)
         new_w = int(w * scale)
         new_h = int(h * scale)
 
-        display_img = cv2.resize(display_img, (new_w, new_h))
+        # The fitted image is written into the top-left of one canvas-sized
+        # buffer that is only reallocated when the canvas size changes; PIL
+        # copies the pixels out of it below
+        buf_shape = (canvas_height, canvas_width) + warped.shape[2:]
+        if self.preview_buf is None or self.preview_buf.shape != buf_shape:
+            self.preview_buf = np.empty(buf_shape, dtype=warped.dtype)
+        display_img = self.preview_buf[:new_h, :new_w]
+
+        # INTER_AREA for shrinking; a document that already fits is copied as-is
+        if scale < 1.0:
+            cv2.resize(warped, (new_w, new_h), dst=display_img, interpolation=cv2.INTER_AREA)
+        else:
+            np.copyto(display_img, warped)
+
+        # Convert to PhotoImage; PIL swaps BGR to RGB while copying the buffer,
+        # reading rows with the buffer's full row stride
+        img_pil = Image.frombuffer("RGB", (new_w, new_h), self.preview_buf, "raw", "BGR",
+                                   self.preview_buf.strides[0], 1)
+
+        # Paste into this document's previous PhotoImage when the size still fits
+        if (cached_preview is not None
+                and (cached_preview[1].width(), cached_preview[1].height()) == (new_w, new_h)):
+            photo = cached_preview[1]
+            photo.paste(img_pil)
+        else:
+            photo = ImageTk.PhotoImage(img_pil)
+        data['preview'] = (key, photo)
 
-        # Convert to PhotoImage
-        img_pil = Image.fromarray(display_img)
-        self.photo = ImageTk.PhotoImage(img_pil)
+        self.show_preview_photo(photo, canvas_width, canvas_height)
 
-        # Display on canvas
-        self.canvas.delete("all")
-        self.canvas.create_image(canvas_width // 2, canvas_height // 2, image=self.photo)
+    def on_canvas_configure(self, event):
+        """Remember the preview canvas size"""
+        self.canvas_size = (event.width, event.height)
+
+    def show_preview_photo(self, photo, canvas_width, canvas_height):
+        """Show a preview PhotoImage centered on the canvas"""
+        self.photo = photo
+
+        # Display on canvas, reusing the preview item while it exists
+        x, y = canvas_width // 2, canvas_height // 2
+        if self.canvas.find_withtag("preview"):
+            self.canvas.itemconfig("preview", image=self.photo)
+            self.canvas.coords("preview", x, y)
+        else:
+            self.canvas.create_image(x, y, image=self.photo, tags="preview")
 
         # Update label
         self.image_label.config(text=f"Image {self.current_preview_index + 1} of {len(self.cropped_images)}")
@@ -1126,12 +1476,11 @@ class ScannerGUI:
         if not self.cropped_images:
             return
 
-        data = self.cropped_images[self.current_preview_index]
-        image = data['image']
-        corners = data['corners']
+        corners = self.cropped_images[self.current_preview_index]['corners']
 
-        # Open adjustment window
-        CornerAdjustmentWindow(self.root, image, corners, self.on_corners_adjusted)
+        # Open adjustment window on the unrotated scan
+        CornerAdjustmentWindow(self.root, self.full_scan_image, corners, self.on_corners_adjusted,
+                               self.adjust_display_cache)
 
     def on_corners_adjusted(self, new_corners):
         """Callback when corners are adjusted"""
@@ -1140,37 +1489,81 @@ class ScannerGUI:
             self.display_preview()
             self.log(f"Corners adjusted for image {self.current_preview_index + 1}")
 
-    def four_point_transform(self, image, pts):
-        """Apply perspective transform"""
+    def perspective_transform(self, pts):
+        """Return the perspective matrix, output size and ordered corners for pts"""
         rect = self.order_points(pts)
-        (tl, tr, br, bl) = rect
 
-        widthA = np.sqrt(((br[0] - bl[0]) ** 2) + ((br[1] - bl[1]) ** 2))
-        widthB = np.sqrt(((tr[0] - tl[0]) ** 2) + ((tr[1] - tl[1]) ** 2))
+        # Edge lengths on plain floats; indexing the array per coordinate would
+        # create a numpy scalar for every term
+        (tl, tr, br, bl) = rect.tolist()
+
+        widthA = math.hypot(br[0] - bl[0], br[1] - bl[1])
+        widthB = math.hypot(tr[0] - tl[0], tr[1] - tl[1])
         maxWidth = max(int(widthA), int(widthB))
 
-        heightA = np.sqrt(((tr[0] - br[0]) ** 2) + ((tr[1] - br[1]) ** 2))
-        heightB = np.sqrt(((tl[0] - bl[0]) ** 2) + ((tl[1] - bl[1]) ** 2))
+        heightA = math.hypot(tr[0] - br[0], tr[1] - br[1])
+        heightB = math.hypot(tl[0] - bl[0], tl[1] - bl[1])
         maxHeight = max(int(heightA), int(heightB))
 
         dst = np.array([[0, 0], [maxWidth - 1, 0],
                         [maxWidth - 1, maxHeight - 1], [0, maxHeight - 1]], dtype="float32")
 
         M = cv2.getPerspectiveTransform(rect, dst)
-        warped = cv2.warpPerspective(image, M, (maxWidth, maxHeight))
+        return M, (maxWidth, maxHeight), rect
+
+    def four_point_transform(self, image, pts, cache_map=False):
+        """Apply perspective transform"""
+        M, (maxWidth, maxHeight), rect = self.perspective_transform(pts)
+
+        # An upright box is cropped with a slice; it is a view of image and
+        # must not be modified
+        sliced = axis_aligned_slice(image, rect, (maxWidth, maxHeight))
+        if sliced is not None:
+            return sliced
+
+        # Reuse the output buffer while the output shape stays the same. The
+        # next call overwrites it, so copy the result if it has to outlive that.
+        out_shape = (maxHeight, maxWidth) + image.shape[2:]
+        if self.warp_buf is None or self.warp_buf.shape != out_shape:
+            self.warp_buf = np.empty(out_shape, dtype=image.dtype)
+
+        # Reuse the cached map when the geometry has not changed
+        key = (rect.tobytes(), maxWidth, maxHeight)
+        if self.warp_map_cache is not None and self.warp_map_cache[0] == key:
+            _, map1, map2 = self.warp_map_cache
+            return cv2.remap(image, map1, map2, cv2.INTER_LINEAR, dst=self.warp_buf)
+
+        # With cache_map the map is kept, so redrawing the same geometry
+        # (rotation, crop, resize) is a plain remap
+        if not cache_map:
+            return cv2.warpPerspective(image, M, (maxWidth, maxHeight), dst=self.warp_buf)
+
+        # With identity camera matrices and no distortion the rectify map is
+        # exactly the perspective map of M
+        identity = np.eye(3)
+        map1, map2 = cv2.initUndistortRectifyMap(identity, None, identity, M,
+                                                 (maxWidth, maxHeight), cv2.CV_16SC2)
+        self.warp_map_cache = (key, map1, map2)
+        warped = cv2.remap(image, map1, map2, cv2.INTER_LINEAR, dst=self.warp_buf)
 
         return warped
 
     def order_points(self, pts):
         """Order points: top-left, top-right, bottom-right, bottom-left"""
-        rect = np.zeros((4, 2), dtype="float32")
-        s = pts.sum(axis=1)
-        rect[0] = pts[np.argmin(s)]
-        rect[2] = pts[np.argmax(s)]
-        diff = np.diff(pts, axis=1)
-        rect[1] = pts[np.argmin(diff)]
-        rect[3] = pts[np.argmax(diff)]
-        return rect
+        # Work on the four points as plain floats; on a 4x2 array each numpy
+        # call costs more in dispatch than in arithmetic
+        points = np.asarray(pts, dtype="float32").tolist()
+        cx = sum(x for x, _ in points) / 4
+        cy = sum(y for _, y in points) / 4
+
+        # Sorting by angle around the centroid gives the clockwise order on screen
+        # (y points down) for any convex quadrilateral, unlike picking the
+        # sum/diff extremes, which can select the same corner twice on skewed boxes
+        points.sort(key=lambda p: math.atan2(p[1] - cy, p[0] - cx))
+
+        # Start at the top-left corner
+        start = min(range(4), key=lambda i: points[i][0] + points[i][1])
+        return np.array(points[start:] + points[:start], dtype="float32")
 
     def enable_preview_controls(self):
         """Enable preview control buttons"""
@@ -1243,12 +1636,14 @@ class ScannerGUI:
                     break
                 doc_counter += 1
 
-            # Save each image
+            crop_px = self.crop_pixels_var.get()
+            white_balance_factors = self.settings.get("white_balance_factors")
+            scan = self.full_scan_image
+
+            # Collect one save job per image, validating all EXIF dates first
+            jobs = []
             saved_files = []
             for idx, data in enumerate(self.cropped_images):
-                image = data['image']
-                corners = data['corners']
-
                 # Get EXIF data for this image
                 exif_data = self.image_exif_data.get(idx, {"date": "", "title": ""})
                 exif_date = exif_data.get("date", "").strip()
@@ -1270,56 +1665,116 @@ class ScannerGUI:
                                              f"EXIF date for image {idx + 1} must be in format YYYY:MM:DD (e.g., 2024:12:25)")
                         return
 
-                # Apply transform and crop
-                warped = self.four_point_transform(image, corners)
-                crop_px = self.crop_pixels_var.get()
-                if crop_px > 0:
-                    h, w = warped.shape[:2]
-                    if h > 2 * crop_px and w > 2 * crop_px:
-                        warped = warped[crop_px:h - crop_px, crop_px:w - crop_px]
+                matrix, size, rect = self.perspective_transform(data['corners'])
 
-                # Apply white balance correction
-                warped = self.apply_white_balance(warped)
+                # Reuse the preview's warp when the corners and crop still match
+                cached = data.get('warped')
+                if cached is not None and cached[0] == (data['corners'].tobytes(), crop_px):
+                    warped = cached[1]
+                else:
+                    warped = None
 
-                # Save
                 output_filename = f"{date_str} {doc_name}{doc_counter + idx}.jpg"
                 output_path = os.path.join(output_folder, output_filename)
-                cv2.imwrite(output_path, warped, [cv2.IMWRITE_JPEG_QUALITY, jpg_quality])
+                jobs.append((warped, matrix, rect, size, crop_px, data['rotation'],
+                             white_balance_factors, output_path, jpg_quality))
                 saved_files.append((output_path, exif_datetime, exif_title))
-                self.log(f"Saved: {output_path}")
 
-            # Apply EXIF metadata if specified
-            if os.path.exists(EXIFTOOL_PATH):
-                for filepath, exif_datetime, exif_title in saved_files:
-                    if exif_datetime or exif_title:
-                        try:
-                            cmd = [EXIFTOOL_PATH, "-overwrite_original"]
-
-                            if exif_datetime:
-                                cmd.extend([f"-DateTimeOriginal={exif_datetime}",
-                                            f"-CreateDate={exif_datetime}",
-                                            f"-ModifyDate={exif_datetime}"])
-
-                            if exif_title:
-                                cmd.extend([f"-Title={exif_title}",
-                                            f"-XPTitle={exif_title}"])
-
-                            cmd.append(filepath)
-
-                            result = subprocess.run(cmd, capture_output=True, text=True)
-                            if result.returncode == 0:
-                                self.log(f"  EXIF applied to {os.path.basename(filepath)}")
-                            else:
-                                self.log(f"  Warning: EXIF failed for {os.path.basename(filepath)}")
-                        except Exception as e:
-                            self.log(f"  Warning: Could not apply EXIF to {os.path.basename(filepath)}: {e}")
-
-            messagebox.showinfo("Success", f"Saved {len(self.cropped_images)} image(s)")
-            self.reset_preview()
+            # Save in the background; not a daemon so closing the window
+            # does not cut a save short. Lock scanning and editing until it
+            # finishes, so a new batch cannot reuse the same output names.
+            self.set_save_controls_state('disabled')
+            threading.Thread(target=self.save_images_thread,
+                             args=(scan, jobs, saved_files)).start()
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save images: {str(e)}")
 
+    def save_images_thread(self, scan, jobs, saved_files):
+        """Warp, encode and tag the kept images in a separate thread"""
+        try:
+            # Warp and encode the images in parallel worker threads
+            max_workers = min(len(jobs), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for output_path in executor.map(_encode_and_save, [scan] * len(jobs), *zip(*jobs)):
+                    self.log(f"Saved: {output_path}")
+
+            # Apply EXIF metadata if specified
+            self.apply_exif_metadata(saved_files)
+
+            result = (self.on_images_saved, len(jobs))
+        except Exception as e:
+            result = (self.on_save_failed, e)
+
+        try:
+            self.root.after(0, *result)
+        except (RuntimeError, tk.TclError):
+            # The window was closed during the save; nothing left to update
+            pass
+
+    def set_save_controls_state(self, state):
+        """Enable or disable scanning and all preview editing controls"""
+        for widget in (self.scan_btn, self.prev_btn, self.next_btn,
+                       self.rotate_cw_btn, self.rotate_ccw_btn, self.adjust_btn,
+                       self.add_btn, self.remove_btn, self.keep_btn, self.rescan_btn,
+                       self.exif_date_entry, self.exif_title_entry):
+            widget.config(state=state)
+
+    def on_images_saved(self, count):
+        """Report a finished save (runs on the GUI thread)"""
+        messagebox.showinfo("Success", f"Saved {count} image(s)")
+        self.scan_btn.config(state='normal')
+        self.exif_date_entry.config(state='normal')
+        self.exif_title_entry.config(state='normal')
+        self.reset_preview()
+
+    def on_save_failed(self, error):
+        """Report a failed save (runs on the GUI thread)"""
+        messagebox.showerror("Error", f"Failed to save images: {str(error)}")
+        self.set_save_controls_state('normal')
+        self.update_navigation_buttons()
+
+    def apply_exif_metadata(self, saved_files):
+        """Write EXIF date/title tags to saved files with a single exiftool run"""
+        if not os.path.exists(EXIFTOOL_PATH):
+            return
+
+        # One -execute command per file; -common_args applies to each of them
+        cmd = [EXIFTOOL_PATH]
+        tagged_files = []
+        for filepath, exif_datetime, exif_title in saved_files:
+            if not (exif_datetime or exif_title):
+                continue
+
+            if tagged_files:
+                cmd.append("-execute")
+
+            if exif_datetime:
+                cmd.extend([f"-DateTimeOriginal={exif_datetime}",
+                            f"-CreateDate={exif_datetime}",
+                            f"-ModifyDate={exif_datetime}"])
+
+            if exif_title:
+                cmd.extend([f"-Title={exif_title}",
+                            f"-XPTitle={exif_title}"])
+
+            cmd.append(filepath)
+            tagged_files.append(os.path.basename(filepath))
+
+        if not tagged_files:
+            return
+        cmd.extend(["-common_args", "-overwrite_original"])
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                for filename in tagged_files:
+                    self.log(f"  EXIF applied to {filename}")
+            else:
+                self.log(f"  Warning: EXIF failed for {', '.join(tagged_files)}")
+        except Exception as e:
+            self.log(f"  Warning: Could not apply EXIF to {', '.join(tagged_files)}: {e}")
+
     def rescan(self):
         """Discard current scan and allow rescanning"""
         if messagebox.askyesno("Rescan", "Discard current scan and rescan?"):
@@ -1331,6 +1786,9 @@ class ScannerGUI:
         self.cropped_images = []
         self.current_preview_index = 0
         self.full_scan_image = None
+        self.adjust_display_cache.clear()
+        self.warp_map_cache = None
+        self.warp_buf = None
         self.image_exif_data = {}
         self.exif_date_var.set("")
         self.exif_title_var.set("")